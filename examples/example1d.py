@@ -8,6 +8,12 @@ from pysofe.pde import Poisson
 
 from numpy import array, sin, pi, logical_or, where
 
+# Python 2 compatibility
+try:
+    input = raw_input
+except NameError:
+    pass
+
 # create mesh
 nodes = array([[0.0], [0.25], [0.5], [0.75], [1.0]])
 cells = array([[1,2], [2,3], [3,4], [4,5]])
@@ -36,7 +42,7 @@ from pysofe.spaces.functions import FEFunction
 u = FEFunction(fes, sol)
 
 pysofe.show(u)
-raw_input("Press Enter to continue...")
+input("Press Enter to continue...")
 
 # from IPython import embed as IPS
 # IPS()
@@ -11,13 +11,13 @@ in python.
 # current version
 __version__ = '0.1.0'
 
-import elements
-import meshes
-import quadrature
-import spaces
-import pde
-import utils
-import visualization
+from . import elements
+from . import meshes
+from . import quadrature
+from . import spaces
+from . import pde
+from . import utils
+from . import visualization
 
 from .elements import P1, P2
 from .meshes import Mesh, UnitSquareMesh
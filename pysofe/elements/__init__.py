@@ -2,6 +2,6 @@
 Provides the data structure for finite elements.
 """
 
-import simple
+from . import simple
 
-from simple.lagrange import P1, P2
+from .simple.lagrange import P1, P2
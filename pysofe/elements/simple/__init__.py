@@ -2,5 +2,5 @@
 Provides classes for `simple` finite elements. 
 """
 
-import lagrange
+from . import lagrange
 from .lagrange import P1, P2
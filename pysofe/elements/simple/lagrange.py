@@ -6,6 +6,75 @@ Provides classes for some simple Lagrange type finite elements.
 import numpy as np
 
 from ..base import Element
+from ...utils import njit, HAS_NUMBA
+
+# the P1 basis functions are evaluated very frequently (e.g. by the
+# reference maps) for only a few points so their evaluation is done
+# by a (possibly) compiled kernel to reduce the interpreter overhead
+
+@njit(cache=True, fastmath=True)
+def _p1_d0(points, nB):
+    nP = points.shape[1]
+    basis = np.empty((nB, nP))
+
+    basis[0,:] = 1. - points.sum(axis=0)
+    basis[1:,:] = points
+
+    return basis
+
+# if the kernels are compiled, versions with a fixed dimension
+# allow the loops to be fully unrolled and vectorized
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _p1_d0_1d(points):
+    nP = points.shape[1]
+    basis = np.empty((2, nP))
+
+    for p in range(nP):
+        x = points[0,p]
+
+        basis[0,p] = 1. - x
+        basis[1,p] = x
+
+    return basis
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _p1_d0_2d(points):
+    nP = points.shape[1]
+    basis = np.empty((3, nP))
+
+    for p in range(nP):
+        x = points[0,p]
+        y = points[1,p]
+
+        basis[0,p] = 1. - x - y
+        basis[1,p] = x
+        basis[2,p] = y
+
+    return basis
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _p1_d0_3d(points):
+    nP = points.shape[1]
+    basis = np.empty((4, nP))
+
+    for p in range(nP):
+        x = points[0,p]
+        y = points[1,p]
+        z = points[2,p]
+
+        basis[0,p] = 1. - x - y - z
+        basis[1,p] = x
+        basis[2,p] = y
+        basis[3,p] = z
+
+    return basis
+
+if HAS_NUMBA:
+    _p1_d0_kernels = {1: _p1_d0_1d, 2: _p1_d0_2d, 3: _p1_d0_3d}
+else:
+    # the point loops would be slow if they are interpreted
+    _p1_d0_kernels = dict()
 
 class P1(Element):
     """
@@ -29,6 +98,25 @@ class P1(Element):
 
         self._dof_tuple = (1, 0, 0, 0)[:(dimension+1)]
 
+        # the derivatives of the basis functions are constant so we
+        # set them up once for the entities of every dimension and
+        # only broadcast them to the number of points when evaluated
+        self._d1_templates = dict()
+        self._d2_templates = dict()
+
+        for d in range(dimension + 1):
+            d1_template = np.zeros((self.n_basis[d], 1, d))
+            d1_template[0] = -1.
+            d1_template[1:,0,:] = np.eye(d)
+
+            d2_template = np.zeros((self.n_basis[d], 1, d, d))
+
+            for template in (d1_template, d2_template):
+                template.flags.writeable = False
+
+            self._d1_templates[d] = d1_template
+            self._d2_templates[d] = d2_template
+
     def _eval_d0basis(self, points):
         # determine number of points and their dimension
         nD, nP = points.shape
@@ -38,11 +126,13 @@ class P1(Element):
         nB = self.n_basis[nD]
 
         # evaluate the basis functions
-        basis = np.zeros((nB, nP))
+        # (using the kernel specialized for the points' dimension if available)
+        points = np.asarray(points, dtype=float)
 
-        basis[0] = 1. - points.sum(axis=0)
-        for i in xrange(nD):
-            basis[i+1] = points[i]
+        if nD in _p1_d0_kernels:
+            basis = _p1_d0_kernels[nD](points)
+        else:
+            basis = _p1_d0(points, nB)
 
         return basis
 
@@ -54,12 +144,9 @@ class P1(Element):
         # the entities of this dimension
         nB = self.n_basis[nD]
 
-        # evaluate the basis functions
-        basis = np.zeros((nB, nP, nD))
-
-        basis[0] = -1.
-        for i in xrange(nD):
-            basis[i+1,:,i] = 1.
+        # broadcast the constant derivatives to all points
+        # (this is a read-only view)
+        basis = np.broadcast_to(self._d1_templates[nD], (nB, nP, nD))
 
         return basis
 
@@ -71,8 +158,9 @@ class P1(Element):
         # the entities of this dimension
         nB = self.n_basis[nD]
 
-        # evaluate the basis functions
-        basis = np.zeros((nB, nP, nD, nD))
+        # broadcast the constant derivatives to all points
+        # (this is a read-only view)
+        basis = np.broadcast_to(self._d2_templates[nD], (nB, nP, nD, nD))
 
         return basis
 
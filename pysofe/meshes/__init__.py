@@ -13,10 +13,10 @@ also has an instance of the |ReferenceMap| class as an attribute to
 connect the physical mesh entities with the reference domain.
 """
 
-import mesh
-import geometry
-import topology
-import reference_map
-import refinements
+from . import mesh
+from . import geometry
+from . import topology
+from . import reference_map
+from . import refinements
 
 from .mesh import Mesh, UnitSquareMesh
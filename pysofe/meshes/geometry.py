@@ -9,6 +9,11 @@ class MeshGeometry(object):
     """
     Stores geometrical information of a mesh.
 
+    The node coordinates are stored row-wise (nNodes x nD) as well as
+    column-wise (nD x nNodes) in a C-contiguous array so that operations
+    along the nodes of a single coordinate direction access contiguous
+    memory.
+
     Parameters
     ----------
 
@@ -24,7 +29,7 @@ class MeshGeometry(object):
         if nodes.ndim > 2:
             raise ValueError("Invalid dimension of nodes array ({})".format(nodes.ndim))
 
-        self._nodes = nodes
+        self._set_nodes(nodes)
 
     @property
     def nodes(self):
@@ -32,3 +37,25 @@ class MeshGeometry(object):
         The coordinates of the mesh grid points
         """
         return self._nodes
+
+    @property
+    def nodes_soa(self):
+        """
+        The coordinates of the mesh grid points stored column-wise,
+        i.e. one contiguous row for each spatial dimension
+        """
+        return self._nodes_soa
+
+    def _set_nodes(self, nodes):
+        """
+        Sets the coordinates of the mesh grid points in both layouts.
+
+        Parameters
+        ----------
+
+        nodes : numpy.ndarray
+            The coordinates of the mesh grid points (row-wise)
+        """
+
+        self._nodes = nodes
+        self._nodes_soa = np.ascontiguousarray(nodes.T)
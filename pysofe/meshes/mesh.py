@@ -6,10 +6,11 @@ of the partial differential equation.
 # IMPORTS
 import numpy as np
 
-import refinements
+from . import refinements
 from .geometry import MeshGeometry
 from .topology import MeshTopology
 from .reference_map import ReferenceMap
+from ..utils import as_index_array
 
 # DEBUGGING
 from IPython import embed as IPS
@@ -34,8 +35,10 @@ class Mesh(object):
 
     def __init__(self, nodes, connectivity):
         # transform input arguments if neccessary
-        nodes = np.atleast_2d(nodes)
-        connectivity = np.asarray(connectivity, dtype=int)
+        # (using 32 bit vertex indices to reduce the memory footprint
+        # of the connectivity arrays derived from them)
+        nodes = np.ascontiguousarray(np.atleast_2d(nodes), dtype=np.float64)
+        connectivity = as_index_array(connectivity)
 
         # check input arguments
         assert 1 <= nodes.shape[1] <= 3
@@ -50,6 +53,10 @@ class Mesh(object):
         # init reference maps class
         self.ref_map = ReferenceMap(self)
 
+        # counts the modifications of the mesh so that dependent
+        # objects can invalidate data they derived from it
+        self._version = 0
+
     @property
     def dimension(self):
         """
@@ -57,6 +64,13 @@ class Mesh(object):
         """
         return self._dimension
 
+    @property
+    def version(self):
+        """
+        The number of modifications (e.g. refinements) of the mesh.
+        """
+        return self._version
+
     @property
     def nodes(self):
         """
@@ -121,24 +135,25 @@ class Mesh(object):
             # the given function which shall return True for all
             # those that belong to the specified part
 
-            # to compute the centroids we need the vertex indices of
-            # every facet and the corresponding node coordinates
-            facet_vertices = self.facets.compress(boundary_mask, axis=0)
-            facet_vertex_coordinates = self.nodes.take(facet_vertices - 1, axis=0)
-            centroids = facet_vertex_coordinates.mean(axis=1)
+            # to compute the centroids we apply the (cached) operator that
+            # averages the node coordinates over the facets and keep those
+            # of the boundary facets which avoids slicing the operator
+            # (its number of columns is given by the largest vertex index
+            # so there might be trailing nodes that don't belong to any facet)
+            averaging = self.topology.get_averaging_operator(d=self.dimension-1)
+            centroids = averaging.dot(self.nodes[:averaging.shape[1]])
+            centroids = centroids.compress(boundary_mask, axis=0)
 
             # pass them to the given function (column-wise)
             try:
-                part_mask = fnc(centroids.T)
-            except:
+                part_mask = np.asarray(fnc(centroids.T), dtype=bool)
+            except (TypeError, ValueError, IndexError):
                 # given function might not be vectorized
-                # so try looping over the centroids
+                # so call it for every single centroid
                 # --> may be slow
                 ncentroids = np.size(centroids, axis=0)
-                part_mask = np.empty(shape=(ncentroids,), dtype=bool)
-
-                for i in xrange(ncentroids):
-                    part_mask[i] = fnc(centroids[i,:])
+                part_mask = np.fromiter((fnc(centroid) for centroid in centroids),
+                                        dtype=bool, count=ncentroids)
 
             boundary_mask[boundary_mask] = np.logical_and(boundary_mask[boundary_mask], part_mask)
 
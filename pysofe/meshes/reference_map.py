@@ -29,6 +29,14 @@ class ReferenceMap(object):
         # hence linear shape element
         self._shape_elem = P1(dimension=mesh.dimension)
 
+    @property
+    def is_affine(self):
+        """
+        Whether the reference maps are affine, i.e. their jacobians
+        are constant on each mesh entity.
+        """
+        return self._shape_elem.order == 1
+
     def eval(self, points, deriv=0):
         """
         Evaluates each member of the family of reference maps
@@ -78,17 +86,24 @@ class ReferenceMap(object):
         vertices = self._mesh.topology.get_entities(d=dim)
 
         # get the coordinates of all the entities' vertices
-        coords = self._mesh.nodes.take(vertices - 1, axis=0)    # nE x nB x nD
+        # (using the column-wise layout of the nodes)
+        coords = self._mesh.geometry.nodes_soa.take(vertices - 1, axis=1)    # nD x nE x nB
 
+        # contract the vertex coordinates with the basis functions
+        # (optimizing lets numpy dispatch the contraction to BLAS
+        # instead of running it as a plain loop)
         if deriv == 0:
             # basis: nB x nP
-            maps = (coords[:,:,None,:] * basis[None,:,:,None]).sum(axis=1)
+            maps = np.einsum('deb,bp->epd', coords, basis,
+                             optimize=True)
         elif deriv == 1:
             # basis: nB x nP x nD
-            maps = (coords[:,:,None,:,None] * basis[None,:,:,None,:]).sum(axis=1)
+            maps = np.einsum('deb,bpk->epdk', coords, basis,
+                             optimize=True)
         elif deriv == 2:
             # basis: nB x nP x nD x nD
-            maps = (coords[:,:,None,:,None,None] * basis[None,:,:,None,:,:]).sum(axis=1)
+            maps = np.einsum('deb,bpkl->epdkl', coords, basis,
+                             optimize=True)
 
         return maps
 
@@ -2,7 +2,7 @@
 Provides refinement methods for the finite element meshes.
 """
 
-import uniform
+from . import uniform
 
 from .uniform import uniform_refine_simplices
 
@@ -27,14 +27,17 @@ def refine(mesh, method='uniform', inplace=True, **kwargs):
     if method == 'uniform':
         times = kwargs.get('times', 1)
 
-        for i in xrange(times):
+        for i in range(times):
             new_nodes, new_cells = uniform_refine_simplices(mesh)
             
             if inplace:
                 # inplace refinement
-                mesh.geometry._nodes = new_nodes
+                mesh.geometry._set_nodes(new_nodes)
                 mesh.topology._reset()
                 mesh.topology._init_incidence(cells=new_cells)
+
+                # let dependent objects know that the mesh has changed
+                mesh._version += 1
             else:
                 mesh = Mesh(new_nodes, new_cells)
     else:
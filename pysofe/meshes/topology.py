@@ -7,7 +7,7 @@ import numpy as np
 from scipy import sparse
 import itertools
 
-from ..utils import unique_rows
+from ..utils import unique_rows, as_index_array
 
 # DEBUGGING
 from IPython import embed as IPS
@@ -29,7 +29,7 @@ class MeshTopology(object):
 
     def __init__(self, cells, dimension):
         # make sure cells array has correct type
-        cells = np.asarray(cells, dtype='int')
+        cells = as_index_array(cells)
 
         # check input
         if not cells.ndim == 2:
@@ -46,9 +46,13 @@ class MeshTopology(object):
         # the following dictionary is used to store every incidence relation
         # of the mesh entities once they have been computed to avoid recomputation
         self._incidence = dict.fromkeys(range(dimension + 1))
-        for i in xrange(dimension + 1):
+        for i in range(dimension + 1):
             self._incidence[i] = dict.fromkeys(range(dimension + 1))
 
+        # the operators that average vertex data over the mesh entities
+        # are stored as well once they have been computed
+        self._averaging = dict.fromkeys(range(dimension + 1))
+
         # initialize incidence relations
         self._init_incidence(cells)
 
@@ -65,6 +69,10 @@ class MeshTopology(object):
             The connectivity array of the mesh cells
         """
 
+        # make sure cells array has correct type
+        # (e.g. if the cells result from a refinement)
+        cells = as_index_array(cells)
+
         # get number of cells and their number of vertices
         ncells, nvertices = cells.shape
 
@@ -120,11 +128,11 @@ class MeshTopology(object):
 
         # make sure the relation `d -> 0` is already
         # computed for each dimension
-        for d in xrange(self._dimension + 1):
+        for d in range(self._dimension + 1):
             self._compute_connectivity(d=d, dd=0)
             
         n_entities = tuple([self._incidence[d][0].shape[0]
-                            for d in xrange(self._dimension + 1)])
+                            for d in range(self._dimension + 1)])
 
         return n_entities
     
@@ -169,6 +177,27 @@ class MeshTopology(object):
 
         return entities
         
+    def get_averaging_operator(self, d):
+        """
+        Returns a sparse matrix that averages given vertex data
+        over each `d`-dimensional mesh entity, e.g. applying it to
+        the node coordinates yields the entities' centroids.
+
+        Parameters
+        ----------
+
+        d : int
+            The topological dimension of the mesh entities
+        """
+
+        if self._averaging[d] is None:
+            incidence_d_0 = self.get_connectivity(d, 0).tocsr().astype(float)
+
+            # every entity of dimension `d` has the same number of vertices
+            self._averaging[d] = incidence_d_0 / self._n_vertices[d]
+
+        return self._averaging[d]
+
     def get_boundary(self, d):
         """
         Returns boolean array specifying the boundary entities 
@@ -273,7 +302,7 @@ class MeshTopology(object):
             self._compute_connectivity(d, dd)
         
         incidence = self._incidence[d][dd]
-        indices = np.asarray(incidence.rows.tolist(), dtype='int') + 1
+        indices = as_index_array(incidence.rows.tolist()) + 1
 
         return indices
         
@@ -469,9 +498,10 @@ class MeshTopology(object):
         """
 
         D = self._dimension
-        for i in xrange(D+1):
-            for j in xrange(D+1):
+        for i in range(D+1):
+            for j in range(D+1):
                 self._incidence[i][j] = None
+            self._averaging[i] = None
 
         if cells is not None:
             self._init_incidence(cells)
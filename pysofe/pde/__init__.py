@@ -3,8 +3,8 @@ Provides the data structures that represent specific
 partial differential equations.
 """
 
-import conditions
-import poisson
+from . import conditions
+from . import poisson
 
 from .conditions import DirichletBC
 from .poisson import Poisson
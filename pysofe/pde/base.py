@@ -6,7 +6,7 @@ Provides the base class for all pde objects.
 import numpy as np
 from scipy import sparse
 
-import conditions
+from . import conditions
 
 # DEBUGGING
 from IPython import embed as IPS
@@ -5,6 +5,6 @@ The purpose of these data structures is to give access
 to the quadrature points and weights for several spatial domains.
 """
 
-import gaussian
+from . import gaussian
 
 from .gaussian import GaussQuadSimp
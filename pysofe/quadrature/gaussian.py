@@ -102,7 +102,7 @@ class GaussQuadSimp(QuadRule):
 # TABLE OF DUNAVANT'S QUADRATURE RULES
 #--------------------------------------
 
-dunavant_points_weights = np.array([
+dunavant_points_weights = [
     [[0.33333333333333,    0.33333333333333,    1.00000000000000]],
     
     [[0.16666666666667,    0.16666666666667,    0.33333333333333],
@@ -218,4 +218,4 @@ dunavant_points_weights = np.array([
      [0.92365593358750,    0.06680325101220,    0.00942166696373],
      [0.06680325101220,    0.00954081540030,    0.00942166696373],
      [0.00954081540030,    0.92365593358750,    0.00942166696373]]
-])
+]
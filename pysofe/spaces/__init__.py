@@ -3,7 +3,7 @@ Provides the data structures for finite element spaces as well as for
 functionals and operators on them.
 """
 
-import space
-import manager
+from . import space
+from . import manager
 
 from .space import FESpace
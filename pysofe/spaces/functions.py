@@ -34,6 +34,12 @@ class FEFunction(object):
         self.fe_space = fe_space
         self.dofs = dof_values
 
+        # preallocated buffers for gathering the dof values of each element
+        self._gather_buffers = dict()
+
+        # contraction paths for the derivative evaluation (by operand shapes)
+        self._einsum_paths = dict()
+
     @property
     def order(self):
         '''
@@ -44,7 +50,7 @@ class FEFunction(object):
     def __call__(self, points, deriv=0):
         return self._evaluate(points, deriv)
     
-    def _evaluate(self, points, deriv=0):
+    def _evaluate(self, points, deriv=0, chunk_size=1024):
         '''
         Evaluates the function or its derivatives at given points.
 
@@ -56,6 +62,10 @@ class FEFunction(object):
 
         deriv : int
             The derivation order
+
+        chunk_size : int
+            The number of elements that are processed at once
+            (for derivatives)
         '''
 
         # determine for which entities to evaluate the function
@@ -65,24 +75,76 @@ class FEFunction(object):
         if dim < self.fe_space.mesh.dimension and deriv > 0:
             raise NotImplementedError('Higher order derivatives for traces not supported!')
 
-        # get dof map and adjust values
-        dof_map = self.fe_space.get_dof_map(d=dim)
-
-        values = self.dofs.take(indices=dof_map-1, axis=0)
+        # get the dof values for every element
+        values = self._gather_dof_values(d=dim)                           # nB x nE
 
         # evaluate basis functions (or derivatives)
         if deriv == 0:
             # values : nB x nE
-            basis = self.fe_space.element.eval_basis(points, deriv)          # nB x nP
+            basis = self.fe_space.eval_local_basis(points, deriv)            # nB x nP
                 
-            #U = np.dot(values.T, basis)                                    # nE x nP
-            U = (values[:,:,None] * basis[:,None,:]).sum(axis=0)           # nE x nP
+            U = np.dot(values.T, basis)                                    # nE x nP
         elif deriv == 1:
             # values : nB x nE
-            dbasis_global = self.fe_space.eval_global_derivatives(points)  # nE x nB x nP x nD
-                
-            U = (values.T[:,:,None,None] * dbasis_global).sum(axis=1)      # nE x nP x nD
+            dbasis = self.fe_space.eval_local_basis(points, deriv)           # nB x nP x nD
+            inv_jac = self.fe_space.get_jacobian_inverse(points)             # nE x (nP|1) x nD x nD
+
+            # instead of transforming the derivatives of every basis function
+            # and summing them up afterwards we contract all operands at once
+            # which never materializes the nE x nB x nP x nD array
+            # (chunkwise over the elements to keep the working set small)
+            nE = values.shape[1]
+            nP, nD = dbasis.shape[1:]
+
+            U = np.empty((nE, nP, nD),
+                         dtype=np.result_type(values, inv_jac, dbasis))
+
+            for start in range(0, nE, chunk_size):
+                end = min(start + chunk_size, nE)
+                operands = (values[:,start:end], inv_jac[start:end], dbasis)
+                key = tuple(op.shape for op in operands)
+
+                if key not in self._einsum_paths:
+                    path, _ = np.einsum_path('be,epji,bpj->epi', *operands,
+                                             optimize='optimal')
+                    self._einsum_paths[key] = path
+
+                U[start:end] = np.einsum('be,epji,bpj->epi', *operands,
+                                         optimize=self._einsum_paths[key])   # nC x nP x nD
         else:
             raise NotImplementedError('Invalid derivation order ({})'.format(d))
 
         return U
+
+    def _gather_dof_values(self, d):
+        '''
+        Returns the dof values associated with each of the
+        `d`-dimensional mesh entities.
+
+        The values are gathered into a buffer that is reused by
+        subsequent calls.
+
+        Parameters
+        ----------
+
+        d : int
+            The topological dimension of the entities
+        '''
+
+        dof_ind, zero_dof = self.fe_space.get_dof_indices(d=d)
+
+        buf = self._gather_buffers.get(d)
+        if buf is None or not buf.shape == dof_ind.shape \
+           or not buf.dtype == self.dofs.dtype:
+            buf = np.empty(dof_ind.shape, dtype=self.dofs.dtype)
+            self._gather_buffers[d] = buf
+
+        # mode 'wrap' avoids internal buffering of the output
+        # (the indices of dofs mapped to `0` wrap around
+        # so their values are reset afterwards)
+        values = np.take(self.dofs, dof_ind, axis=0, out=buf, mode='wrap')
+
+        if zero_dof is not None:
+            values[zero_dof] = 0
+
+        return values
@@ -36,6 +36,14 @@ class DOFManager(object):
         self._mesh = mesh
         self._element = element
 
+        # the dof maps (and data derived from them) only change with the mesh
+        # so we store them once computed together with the mesh version
+        # they belong to
+        self._dof_map_cache = None
+        self._assembly_cache = None
+        self._dof_ind_cache = None
+        self._dof_map_version = None
+
     @property
     def mesh(self):
         return self._mesh
@@ -70,7 +78,7 @@ class DOFManager(object):
             An 1d array marking certain entities of which to get the dof map
         """
         
-        dof_map = self._compute_connectivity_array()[d]
+        dof_map = self._get_connectivity_array()[d]
 
         if mask is not None:
             mask = np.asarray(mask)
@@ -85,6 +93,112 @@ class DOFManager(object):
         
         return dof_map
 
+    def get_dof_indices(self, d):
+        """
+        Returns the zero based indices of the degrees of freedom
+        associated with the `d`-dimensional mesh entities, i.e. the
+        dof map shifted to be usable for indexing arrays.
+
+        Because dofs mapped to `0` (minimum rule) have no valid index
+        a boolean array marking them is returned as well (or `None`
+        if there are no such dofs).
+
+        Parameters
+        ----------
+
+        d : int
+            The topological dimension of the entities for which to return
+            the degrees of freedom indices
+        """
+
+        # the indices only depend on the dof map so we can reuse them
+        # as long as the mesh doesn't change
+        # (they are stored as native integers so that numpy doesn't
+        # have to convert them whenever they are used for indexing)
+        self._get_connectivity_array()
+
+        if d not in self._dof_ind_cache:
+            dof_map = self.get_dof_map(d)
+
+            dof_ind = np.ascontiguousarray(dof_map - 1, dtype=np.intp)
+            zero_dof = (dof_map == 0)
+
+            if not zero_dof.any():
+                zero_dof = None
+
+            for array in (dof_ind, zero_dof):
+                if array is not None:
+                    array.flags.writeable = False
+
+            self._dof_ind_cache[d] = (dof_ind, zero_dof)
+
+        return self._dof_ind_cache[d]
+
+    def get_assembly_indices(self, d, matrix=True, mask=None):
+        """
+        Returns the zero based row and column indices needed to assemble
+        a discrete operator in coordinate format from its entries on the
+        `d`-dimensional mesh entities.
+
+        The entries are expected to be ordered like the C-ordered
+        flattened `nE x nB [x nB]` array of local entries. Because dofs
+        mapped to `0` are dropped (minimum rule) a boolean array marking
+        the remaining entries is returned as well (or `None` if all
+        entries remain).
+
+        Parameters
+        ----------
+
+        d : int
+            The topological dimension of the mesh entities
+
+        matrix : bool
+            Whether the indices are used to assemble a matrix or a vector
+
+        mask : array_like
+            An 1d array marking certain entities to assemble
+        """
+
+        # the indices only depend on the dof map so we can reuse them
+        # as long as the mesh doesn't change (only without masking)
+        self._get_connectivity_array()
+
+        key = (d, bool(matrix))
+        if mask is None and key in self._assembly_cache:
+            return self._assembly_cache[key]
+
+        dof_map = self.get_dof_map(d, mask)       # nB x nE
+
+        if matrix:
+            nB = np.size(dof_map, axis=0)
+            row_ind = np.tile(dof_map, reps=(nB, 1)).ravel(order='F')
+            col_ind = np.repeat(dof_map, repeats=nB, axis=0).ravel(order='F')
+        else:
+            row_ind = dof_map.ravel(order='F')
+            col_ind = np.ones_like(row_ind)
+
+        # apply minimum rule
+        # (if elements have different polynomial degrees)
+        non_zero_dof = (row_ind != 0) & (col_ind != 0)
+
+        if non_zero_dof.all():
+            non_zero_dof = None
+        else:
+            row_ind = row_ind.compress(non_zero_dof)
+            col_ind = col_ind.compress(non_zero_dof)
+
+        row_ind = row_ind - 1
+        col_ind = col_ind - 1
+
+        for array in (row_ind, col_ind, non_zero_dof):
+            if array is not None:
+                array.flags.writeable = False
+
+        if mask is None:
+            self._assembly_cache[key] = (row_ind, col_ind, non_zero_dof)
+
+        return row_ind, col_ind, non_zero_dof
+
     def extract_dofs(self, d, mask=None):
         """
         Returns a boolean array specifying the degrees of freedom 
@@ -120,6 +234,24 @@ class DOFManager(object):
         
         return dofs
 
+    def _get_connectivity_array(self):
+        """
+        Returns the (cached) connectivity arrays for every topological dimension.
+        """
+
+        if self._dof_map_cache is None or \
+           not self._dof_map_version == self.mesh.version:
+            dof_map = self._compute_connectivity_array()
+            for array in dof_map:
+                array.flags.writeable = False
+
+            self._dof_map_cache = dof_map
+            self._assembly_cache = dict()
+            self._dof_ind_cache = dict()
+            self._dof_map_version = self.mesh.version
+
+        return self._dof_map_cache
+
     def _compute_connectivity_array(self):
         """
         Establishes the connection between the local and global degrees of freedom
@@ -146,7 +278,7 @@ class DOFManager(object):
 
         # iterate through all topological dimensions and generate
         # the needed dof indices
-        for topo_dim in xrange(global_dim + 1):
+        for topo_dim in range(global_dim + 1):
             # first we need the number of entities of the current
             # topological dimension
             n_entities = self.mesh.topology.n_entities[topo_dim]
@@ -155,9 +287,15 @@ class DOFManager(object):
             # associated with one entity of the current topological dimension
             dofs_needed = self.element.dof_tuple[topo_dim] * n_entities
 
+            # the dof indices are stored as 32 bit integers
+            # so we have to make sure they don't overflow
+            if n_dofs + dofs_needed >= np.iinfo(np.int32).max:
+                msg = "Number of dofs exceeds the range of 32 bit integers! ({})"
+                raise ValueError(msg.format(n_dofs + dofs_needed))
+
             # generate the new dof indices starting with the current
             # number of dofs generated
-            new_dofs = n_dofs + 1 + np.arange(dofs_needed, dtype=int)
+            new_dofs = n_dofs + 1 + np.arange(dofs_needed, dtype=np.int32)
 
             # reshape them such that the dofs that correspond to one
             # entity are contained in the corresponding column
@@ -179,7 +317,7 @@ class DOFManager(object):
 
         # iterate through the topological dimensions
         # and assemble the dof map for the associated entities
-        for entity_dim in xrange(global_dim + 1):
+        for entity_dim in range(global_dim + 1):
             # init a template for the dof map of the
             # currently considered entities
             temp = [None] * (entity_dim + 1)
@@ -188,7 +326,7 @@ class DOFManager(object):
             # of the currently considered entities and
             # add the corresponding dof indices from the
             # dof index array to the template
-            for sub_dim in xrange(entity_dim + 1):
+            for sub_dim in range(entity_dim + 1):
                 # first we need to get the incidence relation
                 # `entity_dim -> sub_dim`
                 if sub_dim < entity_dim:
@@ -199,12 +337,12 @@ class DOFManager(object):
                 else:
                     assert sub_dim == entity_dim
                     n_entities = self.mesh.topology.n_entities[entity_dim]
-                    incidence = 1 + np.arange(n_entities, dtype=int)[:,None]
+                    incidence = 1 + np.arange(n_entities, dtype=np.int32)[:,None]
 
                 # now we take the corresponding dof indices
                 # and add them to the template
                 sub_dim_dofs = dofs[sub_dim].take(incidence.T - 1, axis=1)
-                temp[sub_dim] = np.reshape(sub_dim_dofs, newshape=(-1, n_entities))
+                temp[sub_dim] = np.reshape(sub_dim_dofs, (-1, n_entities))
 
             dof_map[entity_dim] = np.vstack(temp)
 
@@ -49,10 +49,7 @@ class Operator(object):
         # --> nE x nB [x nB]
         entries = self._compute_entries(codim=codim)
 
-        # get the dof map for the desired entities
-        # --> nB x nE
         dim = self.fe_space.mesh.dimension - codim
-        dof_map = self.fe_space.get_dof_map(d=dim, mask=mask)
         n_dof = self.fe_space.n_dof
 
         # apply masking if neccessary
@@ -61,29 +58,26 @@ class Operator(object):
             assert mask.dtype == bool
 
             entries = entries.compress(mask, axis=0)
-            dof_map = dof_map.compress(mask, axis=1)
 
         # get row and column indices for coo matrix
         # depending on whether to assemble vector or matrix
         if entries.ndim == 2:
-            row_ind = dof_map.ravel(order='F')
-            col_ind = np.ones_like(row_ind)
             shape = (n_dof, 1)
         elif entries.ndim == 3:
-            nB = np.size(entries, axis=1)
-            row_ind = np.tile(dof_map, reps=(nB, 1)).ravel(order='F')
-            col_ind = np.repeat(dof_map, repeats=nB, axis=0).ravel(order='F')
             shape = (n_dof, n_dof)
 
+        row_ind, col_ind, non_zero_dof = self.fe_space.get_assembly_indices(
+            d=dim, matrix=(entries.ndim == 3), mask=mask)
+
         # make entries 1-dimensional
-        entries = entries.ravel(order='C') #!!!
+        # (the discrete operator is always assembled in double precision
+        # even if the fe space works with lower precision)
+        entries = entries.astype(np.float64, copy=False).ravel(order='C') #!!!
 
         # apply minimum rule
         # (if elements have different polynomial degrees)
-        non_zero_dof = (row_ind * col_ind) != 0
-        entries = entries.compress(non_zero_dof)
-        row_ind = row_ind.compress(non_zero_dof) - 1
-        col_ind = col_ind.compress(non_zero_dof) - 1
+        if non_zero_dof is not None:
+            entries = entries.compress(non_zero_dof)
 
         # assemble discrete operator
         M = sparse.coo_matrix((entries, (row_ind, col_ind)), shape=shape)
@@ -150,7 +144,7 @@ class MassMatrix(Operator):
             nP = qpoints.shape[1]
             assert C.shape == (nE, nP)
 
-            basis = self.fe_space.element.eval_basis(points=qpoints, deriv=0)
+            basis = self.fe_space.get_basis_at_quad(d=dim, deriv=0)
             values = basis[None,None,:,:] * basis[None,:,None,:]
         else:
             # 1D special case
@@ -210,7 +204,7 @@ class L2Product(Operator):
             nP = qpoints.shape[1]
             assert F.shape == (nE, nP)
 
-            basis = self.fe_space.element.eval_basis(points=qpoints, deriv=0)
+            basis = self.fe_space.get_basis_at_quad(d=dim, deriv=0)
             values = basis[None,:,:]
         else:
             # 1D special case
@@ -9,10 +9,47 @@ from scipy import sparse
 
 from .manager import DOFManager
 from .. import quadrature
+from ..elements.simple.lagrange import P1
+from ..utils import njit, prange, HAS_NUMBA
 
 # DEBUGGING
 from IPython import embed as IPS
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _apply_inv_jac_batch(inv_jac, local_derivatives, out):
+    """
+    Transforms the local basis functions' first derivatives using the
+    transposed inverse jacobians of every element in parallel.
+
+    Parameters
+    ----------
+
+    inv_jac : numpy.ndarray
+        nE x (nP|1) x nD x nD array of inverse jacobians
+
+    local_derivatives : numpy.ndarray
+        nB x nP x nD array of local derivatives
+
+    out : numpy.ndarray
+        nE x nB x nP x nD array to store the global derivatives in
+    """
+
+    nE = inv_jac.shape[0]
+    nB, nP, nD = local_derivatives.shape
+    affine = (inv_jac.shape[1] == 1)
+
+    for e in prange(nE):
+        for b in range(nB):
+            for p in range(nP):
+                q = 0 if affine else p
+                for i in range(nD):
+                    s = 0.
+                    for j in range(nD):
+                        s += inv_jac[e,q,j,i] * local_derivatives[b,p,j]
+                    out[e,b,p,i] = s
+
+    return out
+
 class FESpace(DOFManager):
     """
     Base class for all finite element spaces.
@@ -28,15 +65,54 @@ class FESpace(DOFManager):
 
     element : pysofe.elements.base.Element
         The reference element
+
+    dtype : numpy.dtype
+        The floating point type used for the basis functions and
+        jacobians (e.g. `numpy.float32` to reduce memory traffic)
     """
 
-    def __init__(self, mesh, element):
+    def __init__(self, mesh, element, dtype=np.float64):
         DOFManager.__init__(self, mesh, element)
+
+        self.dtype = np.dtype(dtype)
         
         # get quadrature rule
         self.quad_rule = quadrature.GaussQuadSimp(order=2*element.order,
                                                   dimension=element.dimension)
 
+        # the reference element and quadrature rule are fixed for the lifetime
+        # of the space so we evaluate the basis functions and their derivatives
+        # at the quadrature points once to avoid recomputation
+        # (the quadrature rule returns copies of its points so we keep
+        # our own reference to be able to recognize them later)
+        self._quad_points = self.quad_rule.points
+
+        self._basis_cache = dict()
+        for d in range(mesh.dimension + 1):
+            for deriv in (0, 1, 2):
+                basis = self.element.eval_basis(self._quad_points[d], deriv)
+                basis = basis.astype(self.dtype, copy=False)
+                basis.flags.writeable = False
+                self._basis_cache[(d, deriv)] = basis
+
+        # the reference maps of straight sided elements are affine so their
+        # jacobians are constant on each element and we only have to store
+        # them once per element instead of for every point
+        # (the cache has to be invalidated whenever the mesh changes)
+        self._affine = mesh.ref_map.is_affine
+        self._inv_jac_cache = dict()
+        self._inv_jac_version = mesh.version
+
+        # the gradients of linear lagrange basis functions are constant
+        # on the reference domain so we keep them for every dimension
+        # (nB x nD) to be able to skip their evaluation completely
+        if isinstance(element, P1):
+            self._p1_grad = dict()
+            for d in range(1, mesh.dimension + 1):
+                grad = np.vstack([-np.ones((1, d)), np.eye(d)]).astype(self.dtype)
+                grad.flags.writeable = False
+                self._p1_grad[d] = grad
+
     def get_quadrature_data(self, d):
         """
         Returns the quadrature points and weighths associated with
@@ -52,7 +128,7 @@ class FESpace(DOFManager):
         """
 
         # first the quadrature points and weights
-        qpoints = self.quad_rule.points[d]
+        qpoints = self._quad_points[d]
         qweights = self.quad_rule.weights[d]
 
         if qpoints.size > 0:
@@ -69,7 +145,55 @@ class FESpace(DOFManager):
 
         return qpoints, qweights, jac_dets
 
-    def eval_global_derivatives(self, points, deriv=1):
+    def get_basis_at_quad(self, d, deriv=0):
+        """
+        Returns the (cached) evaluation of the reference element's basis
+        functions or their derivatives at the quadrature points associated
+        with the `d`-dimensional entities.
+
+        Parameters
+        ----------
+
+        d : int
+            The topological dimension of the entities
+
+        deriv : int
+            The derivation order
+
+        Returns
+        -------
+
+        numpy.ndarray
+            nB x nP [x nD [x nD]]
+        """
+
+        return self._basis_cache[(d, deriv)]
+
+    def eval_local_basis(self, points, deriv=0):
+        """
+        Evaluates the reference element's basis functions or their derivatives
+        at given local points, using the cached values if the points are the
+        quadrature points of this space.
+
+        Parameters
+        ----------
+
+        points : array_like
+            The local points on the reference element
+
+        deriv : int
+            The derivation order
+        """
+
+        d = np.size(points, axis=0)
+
+        if d < len(self._quad_points) and points is self._quad_points[d]:
+            return self.get_basis_at_quad(d, deriv)
+        else:
+            basis = self.element.eval_basis(points, deriv)
+            return basis.astype(self.dtype, copy=False)
+
+    def eval_global_derivatives(self, points, deriv=1, chunk_size=1024):
         """
         Evaluates the global basis functions' derivatives at given local points.
 
@@ -82,11 +206,17 @@ class FESpace(DOFManager):
         deriv : int
             The derivation order
 
+        chunk_size : int
+            The number of elements that are processed at once
+            (ignored for linear lagrange elements and, if numba is
+            available, for first derivatives which are then computed
+            for all elements at once by a compiled kernel)
+
         Returns
         -------
 
         numpy.ndarray
-            (nE x nB x nP x nD [x nD]) array containing for all elements (nE) 
+            (nE x nB x nP x nD [x nD]) array of the space's `dtype` containing for all elements (nE) 
             the evaluation of all basis functions first derivatives (nB) in 
             each point (nP)
         """
@@ -95,24 +225,152 @@ class FESpace(DOFManager):
             msg = "Invalid derivation order for global derivatives! ({})"
             raise ValueError(msg.format(deriv))
         
+        if isinstance(self.element, P1):
+            return self._eval_global_derivatives_p1(points, deriv)
+
         # evaluate inverse jacobians of the reference maps for each element
         # and given point
-        # --> nE x nP x nD x nD
-        inv_jac = self.mesh.ref_map.jacobian_inverse(points)
+        # --> nE x (nP|1) x nD x nD
+        inv_jac = self.get_jacobian_inverse(points)
         
         # get derivatives of the local basis functions at given points
         # --> nB x nP x nD [x nD]
-        local_derivatives = self.element.eval_basis(points, deriv)
+        local_derivatives = self.eval_local_basis(points, deriv)
+
+        # now we transform the local derivatives using the transposed inverse
+        # jacobians, which is a matrix product for every element and point
+        # so we arrange the axes such that the contraction is done by batched
+        # matrix multiplications
+        #
+        # to keep the working set small the elements are processed in chunks
+        # whose results are directly written to the preallocated output
+        nE = inv_jac.shape[0]
+        nB, nP = local_derivatives.shape[:2]
+        nD = inv_jac.shape[-1]
+
+        if deriv == 1 and HAS_NUMBA:
+            # the compiled kernel works on all the elements in parallel
+            # --> nE x nB x nP x nD
+            derivatives = np.empty((nE, nB, nP, nD), dtype=self.dtype)
+
+            return _apply_inv_jac_batch(inv_jac, local_derivatives, derivatives)
+
+        # --> nP x nB x nD [x nD]
+        local_derivatives = local_derivatives.swapaxes(0, 1)
+
+        # --> nE x nP x nB x nD [x nD]
+        derivatives = np.empty((nE, nP, nB) + (nD,) * deriv, dtype=self.dtype)
+
+        if deriv == 2:
+            tmp = np.empty((min(chunk_size, nE), nP, nB, nD, nD), dtype=self.dtype)
+
+        for start in range(0, nE, chunk_size):
+            end = min(start + chunk_size, nE)
+            inv_jac_chunk = inv_jac[start:end]
+
+            if deriv == 1:
+                # nP x nB x nD  @  nC x nP x nD x nD  --> nC x nP x nB x nD
+                np.matmul(local_derivatives[None,:,:,:], inv_jac_chunk,
+                          out=derivatives[start:end])
+            elif deriv == 2:
+                # nC x nP x 1 x nD x nD  @  nP x nB x nD x nD  --> nC x nP x nB x nD x nD
+                tmp_chunk = tmp[:(end - start)]
+                np.matmul(inv_jac_chunk.swapaxes(-2, -1)[:,:,None,:,:],
+                          local_derivatives[None,:,:,:,:],
+                          out=tmp_chunk)
+                np.matmul(tmp_chunk, inv_jac_chunk[:,:,None,:,:],
+                          out=derivatives[start:end])
+
+        # --> nE x nB x nP x nD [x nD]
+        derivatives = derivatives.swapaxes(1, 2)
+
+        return derivatives
+
+    def _eval_global_derivatives_p1(self, points, deriv=1):
+        """
+        Evaluates the global basis functions' derivatives at given local
+        points for linear lagrange elements, using the constant local
+        gradients instead of evaluating the reference element.
+
+        Parameters
+        ----------
+
+        points : array_like
+            The local points on the reference element
+
+        deriv : int
+            The derivation order
+
+        Returns
+        -------
+
+        numpy.ndarray
+            (nE x nB x nP x nD [x nD]) array (possibly a read-only view)
+        """
+
+        points = np.atleast_2d(points)
+        nD, nP = points.shape
+
+        # --> nE x (nP|1) x nD x nD
+        inv_jac = self.get_jacobian_inverse(points)
+        nE = inv_jac.shape[0]
+        nB = self.element.n_basis[nD]
 
-        # now we decompose the matrix vector product of the inverse jacobian
-        # with the local derivatives into an elementwise multiplication and
-        # summation along an axis
-        # therefore we have to expand some dimensions for the multiplication part
         if deriv == 1:
-            derivatives = (inv_jac[:,None,:,:,:] * local_derivatives[None,:,:,:,None]).sum(axis=-2)    # nE x nB x nP x nD
+            # --> nE x nB x (nP|1) x nD
+            derivatives = np.einsum('epji,bj->ebpi', inv_jac, self._p1_grad[nD],
+                                    optimize=True)
+
+            # for affine reference maps the derivatives are the same
+            # in every point so we don't need to store them more than once
+            derivatives = np.broadcast_to(derivatives, (nE, nB, nP, nD))
         elif deriv == 2:
-            derivatives = (inv_jac.swapaxes(-2,-1)[:,None,:,:,:,None] * local_derivatives[None,:,:,None,:,:]).sum(axis=-2)
-            derivatives = (derivatives[:,:,:,:,:,None] * inv_jac[:,None,:,None,:,:]).sum(axis=-2)
+            # the second derivatives vanish
+            derivatives = np.broadcast_to(np.zeros((1, 1, 1, 1, 1), dtype=self.dtype),
+                                          (nE, nB, nP, nD, nD))
 
         return derivatives
 
+    def get_jacobian_inverse(self, points):
+        """
+        Returns the inverse of the reference maps' jacobians evaluated at
+        given local points.
+
+        For affine reference maps the inverse jacobians do not depend on
+        the points so they are computed only once per element, cached
+        and returned with a singleton point axis.
+
+        Parameters
+        ----------
+
+        points : array_like
+            The local points at which to evaluate the jacobians
+
+        Returns
+        -------
+
+        numpy.ndarray
+            nE x (nP|1) x nD x nD
+        """
+
+        points = np.atleast_2d(points)
+
+        if not self._affine or points.size == 0:
+            inv_jac = self.mesh.ref_map.jacobian_inverse(points)
+            return inv_jac.astype(self.dtype, copy=False)
+
+        # drop cached values that belong to a previous state of the mesh
+        if not self._inv_jac_version == self.mesh.version:
+            self._inv_jac_cache = dict()
+            self._inv_jac_version = self.mesh.version
+
+        d = np.size(points, axis=0)
+
+        if d not in self._inv_jac_cache:
+            inv_jac = self.mesh.ref_map.jacobian_inverse(points[:,:1])
+            inv_jac = inv_jac.astype(self.dtype, copy=False)
+            inv_jac.flags.writeable = False
+            self._inv_jac_cache[d] = inv_jac
+
+        return self._inv_jac_cache[d]
+
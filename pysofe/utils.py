@@ -5,6 +5,52 @@ points in the software.
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is an optional dependency so if it is not available
+    # the decorated functions are simply executed by the interpreter
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for :py:func:`numba.njit` that returns the
+        decorated function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        return lambda fnc: fnc
+
+    prange = range
+
+def as_index_array(indices):
+    """
+    Returns the given (one based) indices as a C-contiguous array
+    of 32 bit integers.
+
+    Parameters
+    ----------
+
+    indices : array_like
+        The indices to convert
+
+    Raises
+    ------
+
+    ValueError
+        If the indices don't fit into 32 bit integers
+    """
+
+    indices = np.asarray(indices)
+
+    if indices.size > 0 and indices.max() >= np.iinfo(np.int32).max:
+        msg = "Indices exceed the range of 32 bit integers! ({})"
+        raise ValueError(msg.format(indices.max()))
+
+    return np.ascontiguousarray(indices, dtype=np.int32)
+
 def unique_rows(A, return_index=False, return_inverse=False):
     """
     Returns `B, I, J` where `B` is the array of unique rows from
@@ -101,7 +101,7 @@ class MeshVisualizer(Visualizer):
     
         # nodes
         if 'nodes' in args or show_all:
-            for i in xrange(mesh.nodes.shape[0]):
+            for i in range(mesh.nodes.shape[0]):
                 if mesh.dimension == 1:
                     ax.text(x=mesh.nodes[i,0], y=0., s=i+1,
                             color='red', fontsize=fontsize)
@@ -115,7 +115,7 @@ class MeshVisualizer(Visualizer):
         if 'edges' in args or show_all:
             edges = mesh.edges
             bary = 0.5 * mesh.nodes[edges - 1,:].sum(axis=1)
-            for i in xrange(edges.shape[0]):
+            for i in range(edges.shape[0]):
                 if mesh.dimension == 1:
                     ax.text(x=bary[i,0], y=0, s=i+1,
                             color='green', fontsize=fontsize)
@@ -127,7 +127,7 @@ class MeshVisualizer(Visualizer):
         if mesh.dimension > 1 and ('cells' in args or show_all):
             cells = mesh.cells
             bary = mesh.nodes[cells - 1,:].sum(axis=1) / 3.
-            for i in xrange(cells.shape[0]):
+            for i in range(cells.shape[0]):
                 ax.text(x=bary[i,0], y=bary[i,1], s=i+1,
                         color='blue', fontsize=fontsize)
         
@@ -142,7 +142,7 @@ class MeshVisualizer(Visualizer):
             local_2 = cell_nodes[:,1] + 0.4 * (bary - cell_nodes[:,1])
             local_3 = cell_nodes[:,2] + 0.4 * (bary - cell_nodes[:,2])
             
-            for i in xrange(nE):
+            for i in range(nE):
                 ax.text(x=local_1[i,0], y=local_1[i,1], s=1, color='red', fontsize=fontsize)
                 ax.text(x=local_2[i,0], y=local_2[i,1], s=2, color='red', fontsize=fontsize)
                 ax.text(x=local_3[i,0], y=local_3[i,1], s=3, color='red', fontsize=fontsize)
@@ -242,7 +242,7 @@ class ElementVisualizer(Visualizer):
         if layout is None:
             nB_2 = int(0.5*(nB+1))
 
-            for i in xrange(1, nB_2+1):
+            for i in range(1, nB_2+1):
                 if codim == 0:
                     fig.add_subplot(nB_2,2,2*i-1, projection=project)
                     if 2*i <= nB:
@@ -261,7 +261,7 @@ class ElementVisualizer(Visualizer):
         
             assert np.multiply(*layout) >= nB
         
-            for j in xrange(nB):
+            for j in range(nB):
                 if codim == 0:
                     fig.add_subplot(layout[0], layout[1], j+1, projection=project)
                 elif codim == 1:
@@ -269,14 +269,14 @@ class ElementVisualizer(Visualizer):
 
 
         if element.dimension == 1:
-            for i in xrange(nB):
+            for i in range(nB):
                 fig.axes[i].plot(points.ravel(), basis[i].ravel())
                 #fig.axes[i].set_title(r"$\varphi_{{ {} }}$".format(i+1), fontsize=32)
                 fig.axes[i].set_title(r"$\varphi_{{ {} }}$".format(indices[i]+1), fontsize=32)
         
         elif element.dimension == 2:
             if codim == 0:
-                for i in xrange(nB):
+                for i in range(nB):
                     if typ == 'scatter':
                         fig.axes[i].scatter(points[0], points[1], basis[i])
                     elif typ == 'surface':
@@ -289,7 +289,7 @@ class ElementVisualizer(Visualizer):
                     #fig.axes[i].set_title(r"$\varphi_{{ {} }}$".format(i+1), fontsize=32)
                     fig.axes[i].set_title(r"$\varphi_{{ {} }}$".format(indices[i]+1), fontsize=32)
             elif codim == 1:
-                for i in xrange(nB):
+                for i in range(nB):
                     fig.axes[i].plot(points.ravel(), basis[i].ravel())
                     #fig.axes[i].set_title(r"$\psi_{{ {} }}$".format(i+1), fontsize=32)
                     fig.axes[i].set_title(r"$\psi_{{ {} }}$".format(indices[i]+1), fontsize=32)
@@ -440,7 +440,7 @@ class FunctionVisualizer(Visualizer):
         if d == 0:
             values = values.ravel(order=order).take(I, axis=0)
         elif d == 1:
-            values = np.asarray([values.take(i, axis=-1).ravel(order=order).take(I, axis=0) for i in xrange(values.shape[-1])])
+            values = np.asarray([values.take(i, axis=-1).ravel(order=order).take(I, axis=0) for i in range(values.shape[-1])])
         else:
             raise ValueError('Invalid derivation order for visualization! ({})'.format(d))
 
@@ -478,8 +478,8 @@ class FunctionVisualizer(Visualizer):
         nrows, ncols = axes.shape
 
         # iterate over axes and plot
-        for i in xrange(nrows):
-            for j in xrange(ncols):
+        for i in range(nrows):
+            for j in range(ncols):
                 if i * ncols + j < n_values:
                     # call mpl_toolkit's plot_trisurf
                     axes[i,j].plot_trisurf(X, Y, triangles, Z[i * ncols + j],
@@ -513,8 +513,8 @@ class FunctionVisualizer(Visualizer):
         nrows, ncols = axes.shape
 
         # iterate over axes and plot
-        for i in xrange(nrows):
-            for j in xrange(ncols):
+        for i in range(nrows):
+            for j in range(ncols):
                 if i * ncols + j < n_values:
                     # call matplotlib.pyplot's tripcolor
                     axes[i,j].tripcolor(X, Y, triangles, Z[i * ncols + j],
@@ -610,7 +610,7 @@ class FESpaceVisualizer(Visualizer):
         # plot dofs for each topological dimension
         
         # nodes
-        for i in xrange(mesh.nodes.shape[0]):
+        for i in range(mesh.nodes.shape[0]):
             if mesh.dimension == 1:
                 axes.text(x=mesh.nodes[i,0], y=0., s=entity_dofs[0][i],
                           color='red', fontsize=fontsize)
@@ -624,7 +624,7 @@ class FESpaceVisualizer(Visualizer):
         # edges
         edges = mesh.edges
         bary = 0.5 * mesh.nodes[edges - 1,:].sum(axis=1)
-        for i in xrange(edges.shape[0]):
+        for i in range(edges.shape[0]):
             if mesh.dimension == 1:
                 axes.text(x=bary[i,0], y=0, s=entity_dofs[1][i],
                           color='red', fontsize=fontsize)
@@ -636,7 +636,7 @@ class FESpaceVisualizer(Visualizer):
         if mesh.dimension > 1:
             cells = mesh.cells
             bary = mesh.nodes[cells - 1,:].sum(axis=1) / 3.
-            for i in xrange(cells.shape[0]):
+            for i in range(cells.shape[0]):
                 axes.text(x=bary[i,0], y=bary[i,1], s=entity_dofs[2][i],
                           color='red', fontsize=fontsize)
 
@@ -1,4 +1,4 @@
-#!/usr/bin/python2
+#!/usr/bin/env python
 
 import codecs
 import os
@@ -63,13 +63,17 @@ meta_data = dict(author = "Andreas Kunze",
                                 'Natural Language :: English',
                                 'Operating System :: OS Independent',
                                 'Programming Language :: Python',
+                                'Programming Language :: Python :: 2',
+                                'Programming Language :: Python :: 2.7',
+                                'Programming Language :: Python :: 3',
                                 'Topic :: Scientific/Engineering',
                                 'Topic :: Software Development :: Libraries :: Python Modules'],
                  cmdclass = {'test': PyTest},
                  description = "FEM library for solving PDEs in 1D, 2D and 3D",
                  extras_require = {'testing': ['pytest'],
-                                   'visualization' : ['matplotlib>=1.5.1']},
-                 install_requires = ['numpy>=1.10.4',
+                                   'visualization' : ['matplotlib>=1.5.1'],
+                                   'jit' : ['numba']},
+                 install_requires = ['numpy>=1.12.0',
                                      'scipy>=0.16.1',
                                      'matplotlib>=1.5.0',
                                      'ipython'],
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 
 from pysofe import elements
+from pysofe.elements.simple import lagrange
 from pysofe import utils
 
 simplicial_vertices = dict()
@@ -30,7 +31,7 @@ class TestLagrangeP1(object):
         nerr = 0
         failed = []
         
-        for dim in xrange(1, self.elem.dimension + 1):
+        for dim in range(1, self.elem.dimension + 1):
             basis = self.elem.eval_basis(points=simplicial_vertices[dim], deriv=0)
 
             try:
@@ -44,11 +45,27 @@ class TestLagrangeP1(object):
             msg = '{} D0 evaluation failed, dimensions: ({})'.format(nerr, failed)
             pytest.fail(msg)
 
+    def test_eval_d0basis_kernels(self):
+        kernels = {1: lagrange._p1_d0_1d,
+                   2: lagrange._p1_d0_2d,
+                   3: lagrange._p1_d0_3d}
+
+        for dim in range(1, self.elem.dimension + 1):
+            points = np.random.rand(dim, 5)
+
+            basis = kernels[dim](points)
+            generic = lagrange._p1_d0(points, dim+1)
+
+            assert basis.shape == (dim+1, 5)
+            assert np.allclose(basis, generic)
+            assert np.allclose(basis[0], 1. - points.sum(axis=0))
+            assert np.allclose(basis[1:], points)
+
     def test_eval_d1basis(self):
         nerr = 0
         failed = []
         
-        for dim in xrange(1, self.elem.dimension + 1):
+        for dim in range(1, self.elem.dimension + 1):
             dbasis = self.elem.eval_basis(points=simplicial_vertices[dim], deriv=1)
             nV = dim + 1
 
@@ -85,7 +102,7 @@ class TestLagrangeP1(object):
         nerr = 0
         failed = []
         
-        for dim in xrange(1, self.elem.dimension + 1):
+        for dim in range(1, self.elem.dimension + 1):
             ddbasis = self.elem.eval_basis(points=simplicial_vertices[dim], deriv=2)
             nV = dim + 1
             
@@ -114,7 +131,7 @@ class TestLagrangeP2(object):
         nerr = 0
         failed = []
         
-        for dim in xrange(1, self.elem.dimension + 1):
+        for dim in range(1, self.elem.dimension + 1):
             try:
                 lagrange_points = utils.lagrange_nodes(dim, 2)
                 basis = self.elem.eval_basis(points=lagrange_points,
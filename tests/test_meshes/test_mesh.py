@@ -67,6 +67,12 @@ class TestMesh2D(object):
     def test_mesh_nodes(self):
         assert np.all(self.mesh.nodes == nodes_2d)
 
+    def test_mesh_nodes_soa(self):
+        nodes_soa = self.mesh.geometry.nodes_soa
+
+        assert nodes_soa.flags.c_contiguous
+        assert np.all(nodes_soa == nodes_2d.T)
+
     def test_mesh_edges(self):
         assert np.all(self.mesh.edges
                       == np.array([[1, 5],
@@ -89,6 +95,10 @@ class TestMesh2D(object):
     def test_mesh_cells(self):
         assert np.allclose(self.mesh.cells, cells_2d)
 
+    def test_index_types(self):
+        for d in range(self.mesh.dimension + 1):
+            assert self.mesh.topology.get_entities(d).dtype == np.int32
+
     def test_mesh_faces(self):
         assert np.allclose(self.mesh.faces, self.mesh.cells)
 
@@ -111,6 +121,15 @@ class TestMesh2D(object):
                                      True, False, False, False,
                                      False, False, False, False]))
 
+    def test_boundary_not_vectorized(self):
+        bnd_left_right = lambda x: (x[0] == 0.) or (x[0] == 1.)
+
+        assert np.allclose(self.mesh.boundary(fnc=bnd_left_right),
+                           np.array([False, True, False, False,
+                                     True, True, False, False,
+                                     True, False, False, False,
+                                     False, False, False, False]))
+
     def test_boundary(self):
         bnd_top_bottom = lambda x: np.logical_or(x[1] == 0., x[1] == 1.)
         
@@ -23,6 +23,13 @@ class TestMeshTopology1D(object):
         assert self.topo._dimension == 1
         assert np.all(self.topo._n_vertices == [1, 2])
 
+    def test_index_overflow(self):
+        cells = self.cells1D.copy()
+        cells[-1,-1] = np.iinfo(np.int32).max
+
+        with pytest.raises(ValueError):
+            meshes.topology.MeshTopology(cells=cells, dimension=1)
+
     def test_incidence_1_0_and_0_1(self):
         assert np.all(self.topo.get_connectivity(1,0).toarray()
                       == np.array([[1,1,0,0],
@@ -162,6 +169,19 @@ class TestMeshTopology2D(object):
 
         assert np.all(self.topo.get_boundary(2)
                       == np.array([1,1,1,1]))
+
+    def test_averaging_operator(self):
+        for d in (1, 2):
+            entities = self.topo.get_entities(d)
+            averaging = self.topo.get_averaging_operator(d)
+
+            # averaging the vertex indices
+            vertex_data = np.arange(1., 6.)
+            assert np.allclose(averaging.dot(vertex_data),
+                               vertex_data.take(entities - 1).mean(axis=1))
+
+            # the operator is computed only once
+            assert self.topo.get_averaging_operator(d) is averaging
         
 class TestMeshTopology3D(object):
     # the 3D test mesh connectivity array
@@ -6,6 +6,10 @@ import numpy as np
 import pytest
 
 from pysofe.meshes.mesh import Mesh
+from pysofe.meshes import refinements
+from pysofe.elements.simple.lagrange import P1
+from pysofe.spaces.space import FESpace
+from pysofe.spaces.operators import Laplacian
 
 class TestRefinement1D(object):
     mesh = Mesh(nodes=np.array([[0.],
@@ -53,6 +57,8 @@ class TestRefinement2D(object):
                                      [ 1. ,  0.5],
                                      [ 0.5,  1. ]]))
 
+        assert np.allclose(self.mesh.geometry.nodes_soa, self.mesh.nodes.T)
+
         assert np.allclose(self.mesh.cells,
                            np.array([[1, 5, 6],
                                      [2, 7, 8],
@@ -63,6 +69,20 @@ class TestRefinement2D(object):
                                      [5, 6, 7],
                                      [7, 8, 9]]))
 
+    def test_refine_inplace_version(self):
+        mesh = Mesh(nodes=self.mesh.nodes[:4], connectivity=[[1, 2, 3],
+                                                             [2, 3, 4]])
+        fes = FESpace(mesh, P1(dimension=2))
+        assert fes.n_dof == 4
+
+        version = mesh.version
+        refinements.refine(mesh, method='uniform', inplace=True)
+        assert mesh.version == version + 1
+
+        # data derived from the mesh has to be recomputed
+        assert fes.n_dof == 9
+        assert Laplacian(fes).assemble().shape == (9, 9)
+
 class TestRefinement3D(object):
     mesh = Mesh(nodes=np.array([[0., 0., 0.],
                                 [1., 0., 0.],
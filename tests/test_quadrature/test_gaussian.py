@@ -2,13 +2,15 @@
 Tests the Gaussian quadrature rules.
 """
 
+import math
+
 import numpy as np
 import pytest
 
 from pysofe.quadrature.gaussian import GaussQuadSimp
 
 # set global shortcut and tolerance
-fac = np.math.factorial
+fac = math.factorial
 eps = 1e-8
 
 class TestGaussQuadSimp(object):
@@ -26,8 +28,8 @@ class TestGaussQuadSimp(object):
         x0, x1 = self.quad_rule.points[2]
         w = self.quad_rule.weights[2]
 
-        for p in xrange(self.quad_rule.order + 1):
-            for q in xrange(self.quad_rule.order - p + 1):
+        for p in range(self.quad_rule.order + 1):
+            for q in range(self.quad_rule.order - p + 1):
                 quad = (np.power(x0, p) * np.power(x1, q) * w).sum()
                 exact = (fac(p) * fac(q)) / float(fac(2 + p + q))
 
@@ -37,9 +39,9 @@ class TestGaussQuadSimp(object):
         x0, x1, x2 = self.quad_rule.points[3]
         w = self.quad_rule.weights[3]
 
-        for p in xrange(self.quad_rule.order + 1):
-            for q in xrange(self.quad_rule.order - p + 1):
-                for r in xrange(self.quad_rule.order - p - q + 1):
+        for p in range(self.quad_rule.order + 1):
+            for q in range(self.quad_rule.order - p + 1):
+                for r in range(self.quad_rule.order - p - q + 1):
                     quad = (np.power(x0, p) * np.power(x1, q) * np.power(x2, r) * w).sum()
                     exact = (fac(p) * fac(q) * fac(r)) / float(fac(3 + p + q + r))
 
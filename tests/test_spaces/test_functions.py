@@ -0,0 +1,86 @@
+"""
+Tests the finite element function data structure.
+"""
+
+import numpy as np
+import pytest
+
+from pysofe.meshes.mesh import Mesh
+from pysofe.elements.simple.lagrange import P1
+from pysofe.spaces.space import FESpace
+from pysofe.spaces.functions import FEFunction
+
+# define mesh nodes and cells
+nodes_2d = np.array([[ 0. ,  0. ],
+                     [ 1. ,  0. ],
+                     [ 0. ,  1. ],
+                     [ 1. ,  1. ],
+                     [ 0.5,  0. ],
+                     [ 0. ,  0.5],
+                     [ 0.5,  0.5],
+                     [ 1. ,  0.5],
+                     [ 0.5,  1. ]])
+
+cells_2d = np.array([[1, 5, 6],
+                     [2, 7, 8],
+                     [2, 5, 7],
+                     [3, 7, 9],
+                     [3, 6, 7],
+                     [4, 8, 9],
+                     [5, 6, 7],
+                     [7, 8, 9]])
+
+mesh_2d = Mesh(nodes_2d, cells_2d)
+
+# some local points on the reference domain
+points_2d = np.array([[0.1, 0.6, 0.3],
+                      [0.2, 0.1, 0.3]])
+
+class TestFEFunctionP1(object):
+    fes = FESpace(mesh_2d, P1(dimension=2))
+
+    # the linear function `f(x,y) = 2x - y + 1`
+    # is represented exactly by its nodal values
+    dofs = 2. * nodes_2d[:,0] - nodes_2d[:,1] + 1.
+    fnc = FEFunction(fes, dofs)
+
+    def test_eval_d0(self):
+        global_points = mesh_2d.ref_map.eval(points_2d, deriv=0)   # nE x nP x nD
+        expected = 2. * global_points[...,0] - global_points[...,1] + 1.
+
+        for _ in range(2):
+            U = self.fnc(points_2d, deriv=0)
+
+            assert U.shape == (8, 3)
+            assert np.allclose(U, expected)
+
+    def test_eval_d1(self):
+        for _ in range(2):
+            U = self.fnc(points_2d, deriv=1)
+
+            assert U.shape == (8, 3, 2)
+            assert np.allclose(U[...,0], 2.)
+            assert np.allclose(U[...,1], -1.)
+
+    def test_eval_d1_chunked(self):
+        U = self.fnc._evaluate(points_2d, deriv=1, chunk_size=3)
+
+        assert U.shape == (8, 3, 2)
+        assert np.allclose(U[...,0], 2.)
+        assert np.allclose(U[...,1], -1.)
+
+    def test_gather_zero_dofs(self, monkeypatch):
+        # dofs mapped to `0` (minimum rule) must not pick up
+        # the value of the last dof through index wrap around
+        dof_ind = self.fes.get_dof_indices(d=2)[0].copy()
+        dof_ind[0,0] = -1
+        zero_dof = (dof_ind == -1)
+
+        monkeypatch.setattr(self.fes, 'get_dof_indices',
+                            lambda d: (dof_ind, zero_dof))
+
+        fnc = FEFunction(self.fes, self.dofs)
+        values = fnc._gather_dof_values(d=2)
+
+        assert values[0,0] == 0.
+        assert np.all(values[~zero_dof] == self.dofs[dof_ind[~zero_dof]])
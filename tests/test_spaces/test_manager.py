@@ -39,6 +39,13 @@ mesh_3d = Mesh(nodes_3d, cells_3d)
 elem_3d = Element(dimension=3, order=4, n_basis=(1,5,15,35), n_verts=(1,2,3,4))
 elem_3d._dof_tuple = (1, 3, 3, 1)
 
+def test_dof_overflow():
+    elem = Element(dimension=1, order=3, n_basis=(1,4), n_verts=(1,2))
+    elem._dof_tuple = (1, np.iinfo(np.int32).max)
+
+    with pytest.raises(ValueError):
+        DOFManager(mesh_1d, elem).get_dof_map(d=1)
+
 class TestDOFManager1DP3(object):
     dm = DOFManager(mesh_1d, elem_1d)
 
@@ -130,6 +137,45 @@ class TestDOFManager2DP3(object):
                                            True, True, True, True,
                                            True, True, True, True]))
 
+    def test_assembly_indices(self):
+        dof_map = self.dm.get_dof_map(d=2)
+        nB, nE = dof_map.shape
+
+        row_ind, col_ind, non_zero_dof = self.dm.get_assembly_indices(d=2)
+
+        assert non_zero_dof is None
+        assert row_ind.dtype == np.int32
+        assert row_ind.shape == col_ind.shape == (nE * nB * nB,)
+
+        # entry `(e,i,j)` of the local entries maps to dofs `(j,i)` of `e`
+        local_rows = row_ind.reshape((nE, nB, nB))
+        local_cols = col_ind.reshape((nE, nB, nB))
+        assert np.all(local_rows == (dof_map.T - 1)[:,None,:])
+        assert np.all(local_cols == (dof_map.T - 1)[:,:,None])
+
+        # the indices are computed only once
+        assert self.dm.get_assembly_indices(d=2)[0] is row_ind
+
+    def test_assembly_indices_vector(self):
+        dof_map = self.dm.get_dof_map(d=2)
+
+        row_ind, col_ind, _ = self.dm.get_assembly_indices(d=2, matrix=False)
+
+        assert np.all(row_ind == dof_map.ravel(order='F') - 1)
+        assert np.all(col_ind == 0)
+
+    def test_dof_indices(self):
+        dof_map = self.dm.get_dof_map(d=1)
+
+        dof_ind, zero_dof = self.dm.get_dof_indices(d=1)
+
+        assert zero_dof is None
+        assert dof_ind.dtype == np.intp
+        assert np.all(dof_ind == dof_map - 1)
+
+        # the indices are computed only once
+        assert self.dm.get_dof_indices(d=1)[0] is dof_ind
+
 class TestDOFManager3DP4(object):
     dm = DOFManager(mesh_3d, elem_3d)
 
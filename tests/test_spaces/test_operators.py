@@ -38,3 +38,13 @@ fes_2d = FESpace(mesh_2d, element_2d)
 
 class TestMassMatrix(object):
     pass
+
+class TestLaplacian(object):
+    def test_single_precision_assembly(self):
+        fes_2d_sp = FESpace(mesh_2d, element_2d, dtype=np.float32)
+
+        A = operators.Laplacian(fes_2d).assemble()
+        A_sp = operators.Laplacian(fes_2d_sp).assemble()
+
+        assert A_sp.dtype == np.float64
+        assert np.allclose(A_sp.toarray(), A.toarray(), atol=1e-5)
@@ -0,0 +1,168 @@
+"""
+Tests the finite element space data structure.
+"""
+
+import numpy as np
+import pytest
+
+from pysofe.meshes.mesh import Mesh
+from pysofe.elements.simple.lagrange import P1, P2
+from pysofe.spaces.space import FESpace
+from pysofe.spaces.space import _apply_inv_jac_batch
+
+# define mesh nodes and cells
+nodes_2d = np.array([[ 0. ,  0. ],
+                     [ 1. ,  0. ],
+                     [ 0. ,  1. ],
+                     [ 1. ,  1. ],
+                     [ 0.5,  0. ],
+                     [ 0. ,  0.5],
+                     [ 0.5,  0.5],
+                     [ 1. ,  0.5],
+                     [ 0.5,  1. ]])
+
+cells_2d = np.array([[1, 5, 6],
+                     [2, 7, 8],
+                     [2, 5, 7],
+                     [3, 7, 9],
+                     [3, 6, 7],
+                     [4, 8, 9],
+                     [5, 6, 7],
+                     [7, 8, 9]])
+
+mesh_2d = Mesh(nodes_2d, cells_2d)
+
+# some local points on the reference domain
+points_2d = np.array([[0.1, 0.6, 0.3],
+                      [0.2, 0.1, 0.3]])
+
+def _reference_global_derivatives(fe_space, points, deriv):
+    # straightforward loop based transformation of the
+    # local derivatives used to check the vectorized version
+    inv_jac = fe_space.mesh.ref_map.jacobian_inverse(points)
+    local_derivatives = fe_space.element.eval_basis(points, deriv)
+
+    nE, nP = inv_jac.shape[:2]
+    nB = local_derivatives.shape[0]
+
+    derivatives = np.zeros((nE, nB) + local_derivatives.shape[1:])
+
+    for e in range(nE):
+        for b in range(nB):
+            for p in range(nP):
+                if deriv == 1:
+                    derivatives[e,b,p] = np.dot(inv_jac[e,p].T,
+                                                local_derivatives[b,p])
+                elif deriv == 2:
+                    derivatives[e,b,p] = np.dot(inv_jac[e,p].T,
+                                                np.dot(local_derivatives[b,p],
+                                                       inv_jac[e,p]))
+
+    return derivatives
+
+class TestFESpace2D(object):
+    fes_p1 = FESpace(mesh_2d, P1(dimension=2))
+    fes_p2 = FESpace(mesh_2d, P2(dimension=2))
+
+    def test_eval_global_derivatives_d1(self):
+        for fes in (self.fes_p1, self.fes_p2):
+            derivatives = fes.eval_global_derivatives(points_2d, deriv=1)
+            reference = _reference_global_derivatives(fes, points_2d, deriv=1)
+
+            nE = fes.mesh.cells.shape[0]
+            nB = fes.element.n_basis[2]
+            assert derivatives.shape == (nE, nB, 3, 2)
+            assert np.allclose(derivatives, reference)
+
+    def test_eval_global_derivatives_d2(self):
+        for fes in (self.fes_p1, self.fes_p2):
+            derivatives = fes.eval_global_derivatives(points_2d, deriv=2)
+            reference = _reference_global_derivatives(fes, points_2d, deriv=2)
+
+            nE = fes.mesh.cells.shape[0]
+            nB = fes.element.n_basis[2]
+            assert derivatives.shape == (nE, nB, 3, 2, 2)
+            assert np.allclose(derivatives, reference)
+
+    def test_eval_global_derivatives_invalid_order(self):
+        with pytest.raises(ValueError):
+            self.fes_p1.eval_global_derivatives(points_2d, deriv=0)
+
+    def test_basis_cache(self):
+        for fes in (self.fes_p1, self.fes_p2):
+            for d in range(1, 3):
+                qpoints, _, _ = fes.get_quadrature_data(d)
+
+                for deriv in (0, 1, 2):
+                    basis = fes.get_basis_at_quad(d, deriv)
+
+                    assert np.allclose(basis, fes.element.eval_basis(qpoints, deriv))
+                    assert fes.eval_local_basis(qpoints, deriv) is basis
+                    assert fes.eval_local_basis(qpoints.copy(), deriv) is not basis
+
+    def test_jacobian_inverse_cache_after_refine(self):
+        mesh = Mesh(nodes_2d, cells_2d)
+        fes = FESpace(mesh, P1(dimension=2))
+
+        derivatives = fes.eval_global_derivatives(points_2d, deriv=1)
+        assert derivatives.shape[0] == 8
+
+        version = mesh.version
+        mesh.refine(method='uniform', times=1)
+        assert mesh.version == version + 1
+
+        derivatives = fes.eval_global_derivatives(points_2d, deriv=1)
+        reference = _reference_global_derivatives(fes, points_2d, deriv=1)
+
+        assert derivatives.shape[0] == 32
+        assert np.allclose(derivatives, reference)
+
+    def test_single_precision(self):
+        fes = FESpace(mesh_2d, P1(dimension=2), dtype=np.float32)
+        qpoints, _, _ = fes.get_quadrature_data(2)
+
+        for deriv in (0, 1, 2):
+            assert fes.get_basis_at_quad(2, deriv).dtype == np.float32
+
+        for points in (qpoints, points_2d):
+            derivatives = fes.eval_global_derivatives(points, deriv=1)
+            reference = _reference_global_derivatives(self.fes_p1, points, deriv=1)
+
+            assert derivatives.dtype == np.float32
+            assert np.allclose(derivatives, reference, rtol=1e-5, atol=1e-6)
+
+    def test_eval_global_derivatives_chunked(self):
+        for fes in (self.fes_p1, self.fes_p2):
+            for deriv in (1, 2):
+                derivatives = fes.eval_global_derivatives(points_2d, deriv,
+                                                          chunk_size=3)
+                reference = _reference_global_derivatives(fes, points_2d, deriv)
+
+                assert np.allclose(derivatives, reference)
+
+    def test_eval_global_derivatives_d1_without_numba(self, monkeypatch):
+        # force the batched matrix multiplication instead of the compiled kernel
+        monkeypatch.setattr('pysofe.spaces.space.HAS_NUMBA', False)
+
+        reference = _reference_global_derivatives(self.fes_p2, points_2d, deriv=1)
+
+        for chunk_size in (1024, 3):
+            derivatives = self.fes_p2.eval_global_derivatives(points_2d, deriv=1,
+                                                              chunk_size=chunk_size)
+
+            assert derivatives.shape == reference.shape
+            assert np.allclose(derivatives, reference)
+
+def test_apply_inv_jac_batch():
+    fes = FESpace(mesh_2d, P2(dimension=2))
+
+    local_derivatives = fes.element.eval_basis(points_2d, deriv=1)
+    reference = _reference_global_derivatives(fes, points_2d, deriv=1)
+
+    # per point and (affine) per element inverse jacobians
+    for inv_jac in (mesh_2d.ref_map.jacobian_inverse(points_2d),
+                    fes.get_jacobian_inverse(points_2d)):
+        out = np.empty_like(reference)
+        _apply_inv_jac_batch(inv_jac, local_derivatives, out)
+
+        assert np.allclose(out, reference)